@@ -1,12 +1,18 @@
+import asyncio
 import hashlib
 from contextlib import asynccontextmanager
 from random import randbytes
 from typing import Callable
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import DBAPIError
 
-from database import disconnect_db
-from routers import health_router, texts_router
+from configs import configs
+from database import GroupCommitTimeoutError, disconnect_db, listen_title_changes, text_writer
+from database.engine import is_query_canceled
+from middlewares import CancelOnDisconnectMiddleware, profile_request
+from routers import autocomplete_router, changes_router, health_router, texts_router
 from service_logging import logger
 
 
@@ -14,16 +20,26 @@ from service_logging import logger
 async def lifespan(app: FastAPI):
     # on_startup
     logger.info("FastAPI application starting up...")
+    title_index_listener = asyncio.create_task(listen_title_changes())
 
     yield
 
     # on_shutdown
     logger.info("FastAPI application shutting down...")
+    title_index_listener.cancel()
+    await asyncio.gather(title_index_listener, return_exceptions=True)
+    await text_writer.drain()
     await disconnect_db()
 
 
 service = FastAPI(lifespan=lifespan)
 
+# Добавляется первым, чтобы оказаться самым внутренним middleware.
+service.add_middleware(CancelOnDisconnectMiddleware)
+
+if configs.profiling.ENABLE:
+    service.middleware("http")(profile_request)
+
 
 @service.middleware("http")
 async def add_request_hash(request: Request, call_next: Callable):
@@ -33,5 +49,31 @@ async def add_request_hash(request: Request, call_next: Callable):
         return response
 
 
+def query_timeout_response() -> JSONResponse:
+    detail = "Database query timed out."
+    logger.error(detail)
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": detail},
+    )
+
+
+@service.exception_handler(DBAPIError)
+async def handle_db_error(request: Request, error: DBAPIError) -> JSONResponse:
+    if not is_query_canceled(error):
+        raise error
+
+    return query_timeout_response()
+
+
+@service.exception_handler(GroupCommitTimeoutError)
+async def handle_group_commit_timeout(
+    request: Request, error: GroupCommitTimeoutError
+) -> JSONResponse:
+    return query_timeout_response()
+
+
 service.include_router(health_router)
+service.include_router(changes_router)
+service.include_router(autocomplete_router)
 service.include_router(texts_router)
@@ -0,0 +1,127 @@
+"""Сравнение пропускной способности `POST /` с групповой фиксацией и без нее.
+
+Для каждого уровня конкурентности создается набор текстов через HTTP
+маршрут (в том же процессе, прямым вызовом ASGI приложения), поэтому замер включает
+ограничители допуска с настройками из окружения: без групповой фиксации
+запросы проходят через ограничитель записи, с ней через `create_limiter`.
+Запросы, отклоненные с 503, считаются отдельно. Требуется настроенная БД;
+созданные тексты затем удаляются. Логирование на время замера отключено.
+
+Запуск:
+    python -m benchmarks.group_commit
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from typing import Any
+
+from sqlalchemy import delete, insert
+
+from app import service
+from configs import configs
+from database import disconnect_db
+from database.engine import LocalAsyncSession
+from database.models import LearningText, LearningTextTombstone
+from service_logging import logger
+
+CONCURRENCY = (1, 10, 100, 500)
+VALUE = "v" * 500
+
+
+async def post(path: str, body: dict[str, Any]) -> int:
+    """Выполняет POST запрос к приложению напрямую через ASGI и возвращает статус ответа."""
+    content = json.dumps(body).encode()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"benchmark"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(content)).encode()),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("benchmark", 80),
+    }
+    requested = False
+    finished = asyncio.Event()
+    status = 0
+
+    async def receive() -> dict[str, Any]:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": content, "more_body": False}
+        # Клиент "отключается" только после ответа, иначе запрос будет отменен.
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body" and not message.get("more_body"):
+            finished.set()
+
+    await service(scope, receive, send)
+    return status
+
+
+async def measure(prefix: str, concurrency: int) -> tuple[float, int]:
+    """Возвращает число созданных текстов в секунду и число отказов 503."""
+    total = max(concurrency * 4, 100)
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses = []
+
+    async def worker(i: int) -> None:
+        async with semaphore:
+            body = {"title": f"{prefix}-{i}", "value": VALUE, "transcription": VALUE}
+            statuses.append(await post("/", body))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(total)))
+    elapsed = time.perf_counter() - start
+    return statuses.count(200) / elapsed, statuses.count(503)
+
+
+async def main() -> None:
+    logger.remove()
+    tag = f"benchmark-{uuid.uuid4().hex[:8]}"
+
+    header = f"{'concurrency':<13}{'path':<8}{'rows/s':>10}{'503':>7}"
+    print(header)
+    print("-" * len(header))
+    try:
+        for concurrency in CONCURRENCY:
+            for path, enable in (("single", False), ("group", True)):
+                configs.group_commit.ENABLE = enable
+                prefix = f"{tag}-{path}-{concurrency}"
+                rate, rejected = await measure(prefix, concurrency)
+                print(f"{concurrency:<13}{path:<8}{rate:>10.0f}{rejected:>7}")
+
+    finally:
+        async with LocalAsyncSession() as db:
+            result = await db.execute(
+                delete(LearningText)
+                .where(LearningText.title.startswith(tag))
+                .returning(LearningText.id)
+            )
+            ids = result.scalars().all()
+            # Удаление фиксируется в ленте изменений, как и в обработчиках.
+            if ids:
+                await db.execute(insert(LearningTextTombstone), [{"id": id} for id in ids])
+            await db.commit()
+
+        await disconnect_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+"""Сравнение ORM и облегченного слоя чтения на горячих GET запросах.
+
+Для каждого запроса измеряется процессорное время (CPU) и общее время
+на один вызов, включая построение схемы ответа. Требуется настроенная
+БД с хотя бы одним текстом.
+
+Запуск:
+    python -m benchmarks.read_path
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import func, select
+
+from database import disconnect_db, repository
+from database.engine import LocalAsyncSession
+from database.models import LearningText
+from schemas import DetailLearningTextResponse, LearningTextResponse
+
+ITERATIONS = 2000
+PAGE_SIZE = 50
+
+
+async def measure(fn: Callable[[], Awaitable[Any]]) -> tuple[float, float]:
+    """Возвращает CPU и общее время одного вызова в микросекундах."""
+    for _ in range(ITERATIONS // 10):
+        await fn()
+
+    cpu, wall = time.process_time(), time.perf_counter()
+    for _ in range(ITERATIONS):
+        await fn()
+
+    cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    return cpu / ITERATIONS * 1e6, wall / ITERATIONS * 1e6
+
+
+async def main() -> None:
+    async with LocalAsyncSession() as db:
+        id = (await db.execute(select(LearningText.id).limit(1))).scalar_one_or_none()
+        if id is None:
+            print("The learning_texts table is empty, nothing to measure.")
+            return
+
+        async def orm_text() -> DetailLearningTextResponse:
+            result = await db.execute(select(LearningText).where(LearningText.id == id))
+            return DetailLearningTextResponse.model_validate(result.scalar_one())
+
+        async def core_text() -> DetailLearningTextResponse:
+            return DetailLearningTextResponse.model_validate(await repository.select_text(db, id))
+
+        async def orm_page() -> list[LearningTextResponse]:
+            result = await db.execute(select(LearningText).offset(0).limit(PAGE_SIZE))
+            await db.execute(select(func.count()).select_from(LearningText))
+            return [LearningTextResponse.model_validate(text) for text in result.scalars()]
+
+        async def core_page() -> list[LearningTextResponse]:
+            rows = await repository.select_texts(db, 0, PAGE_SIZE)
+            await repository.count_texts(db)
+            return [LearningTextResponse.model_validate(row) for row in rows]
+
+        header = f"{'case':<22}{'path':<7}{'cpu, us':>10}{'wall, us':>11}"
+        print(header)
+        print("-" * len(header))
+        for name, orm, core in (
+            ("get_text", orm_text, core_text),
+            (f"get_texts, {PAGE_SIZE} items", orm_page, core_page),
+        ):
+            for path, fn in (("orm", orm), ("core", core)):
+                db.expunge_all()
+                cpu, wall = await measure(fn)
+                print(f"{name:<22}{path:<7}{cpu:>10.1f}{wall:>11.1f}")
+
+    await disconnect_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,91 @@
+"""Сравнение JSON и MessagePack на типичных ответах сервиса.
+
+Сравниваются размер тела ответа и время кодирования/декодирования
+страниц списка текстов и массовой выборки детальной информации.
+Кодирование повторяет путь FastAPI: схема -> JSON-совместимый dict -> байты.
+
+Запуск:
+    python -m benchmarks.serialization
+"""
+
+import json
+import timeit
+import uuid
+from typing import Any, Callable
+
+import msgpack
+
+from routers.utils.pagination import PaginatedResponse
+from schemas import DetailLearningTextResponse, LearningTextResponse
+from schemas.examples import TITLE_EXAMPLES, TRANSCRIPTION_EXAMPLES, VALUE_EXAMPLES
+
+
+def json_encode(content: Any) -> bytes:
+    # Те же параметры, что использует starlette.responses.JSONResponse.
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def list_page(size: int) -> dict:
+    items = [
+        LearningTextResponse(id=uuid.uuid4(), title=f"{TITLE_EXAMPLES[i % 3]} #{i}")
+        for i in range(size)
+    ]
+    page = PaginatedResponse[LearningTextResponse](items=items, page=1, size=size, total=10_000)
+    return page.model_dump(mode="json")
+
+
+def bulk_fetch(size: int, paragraphs: int) -> dict:
+    items = [
+        DetailLearningTextResponse(
+            id=uuid.uuid4(),
+            title=f"{TITLE_EXAMPLES[i % 3]} #{i}",
+            value=" ".join(VALUE_EXAMPLES * paragraphs),
+            transcription=" ".join(TRANSCRIPTION_EXAMPLES * paragraphs),
+        )
+        for i in range(size)
+    ]
+    page = PaginatedResponse[DetailLearningTextResponse](
+        items=items, page=1, size=size, total=10_000
+    )
+    return page.model_dump(mode="json")
+
+
+def measure(fn: Callable[[], Any], number: int) -> float:
+    """Возвращает лучшее среднее время одного вызова в микросекундах."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    cases = {
+        "list page, 50 items": list_page(50),
+        "list page, 1000 items": list_page(1000),
+        "bulk fetch, 100 texts": bulk_fetch(100, 10),
+        "bulk fetch, 1000 texts": bulk_fetch(1000, 10),
+    }
+
+    header = f"{'case':<24}{'format':<9}{'bytes':>10}{'encode, us':>13}{'decode, us':>13}"
+    print(header)
+    print("-" * len(header))
+    for name, content in cases.items():
+        number = max(1, 20_000 // len(content["items"]))
+        for fmt, encode, decode in (
+            ("json", json_encode, json.loads),
+            ("msgpack", msgpack.packb, msgpack.unpackb),
+        ):
+            body = encode(content)
+            assert decode(body) == content
+            print(
+                f"{name:<24}{fmt:<9}{len(body):>10}"
+                f"{measure(lambda: encode(content), number):>13.1f}"
+                f"{measure(lambda: decode(body), number):>13.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
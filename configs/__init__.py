@@ -1,7 +1,11 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .admission import AdmissionConfiguration
 from .database import DatabaseConfiguration
 from .graylog import GraylogConfiguration
+from .group_commit import GroupCommitConfiguration
+from .profiling import ProfilingConfiguration
+from .timeouts import TimeoutsConfiguration
 
 
 class ProjectConfiguration(BaseSettings):
@@ -9,6 +13,10 @@ class ProjectConfiguration(BaseSettings):
 
     # * Вложенные группы настроек
     database: DatabaseConfiguration = DatabaseConfiguration()
+    admission: AdmissionConfiguration = AdmissionConfiguration()
+    timeouts: TimeoutsConfiguration = TimeoutsConfiguration()
+    group_commit: GroupCommitConfiguration = GroupCommitConfiguration()
+    profiling: ProfilingConfiguration = ProfilingConfiguration()
     graylog: GraylogConfiguration = GraylogConfiguration()
 
     # * Опциональные переменные
@@ -0,0 +1,13 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class AdmissionConfiguration(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="TEXTS_ADMISSION_")
+
+    # * Опциональные переменные
+    READ_LIMIT: int = 10
+    READ_QUEUE_SIZE: int = 100
+    WRITE_LIMIT: int = 5
+    WRITE_QUEUE_SIZE: int = 50
+    QUEUE_TIMEOUT: float = 2.0
+    RETRY_AFTER: int = 1
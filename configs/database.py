@@ -12,6 +12,7 @@ class DatabaseConfiguration(BaseSettings):
     POSTGRES_USER: str = "service_texts"
     POSTGRES_NAME: str = "texts"
     POSTGRES_PORT: int = 5432
+    SLOW_QUERY_THRESHOLD: int = 500
 
     @property
     def URL(self) -> str:
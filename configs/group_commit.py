@@ -0,0 +1,12 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class GroupCommitConfiguration(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="TEXTS_GROUP_COMMIT_")
+
+    # * Опциональные переменные
+    ENABLE: bool = False
+    WINDOW: float = 0.0
+    MAX_SIZE: int = 100
+    LIMIT: int = 500
+    QUEUE_SIZE: int = 1000
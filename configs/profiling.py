@@ -0,0 +1,11 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class ProfilingConfiguration(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="TEXTS_PROFILING_")
+
+    # * Опциональные переменные
+    ENABLE: bool = False
+    TOKEN: str | None = None
+    INTERVAL: float = 0.001
+    OUTPUT_DIR: str | None = None
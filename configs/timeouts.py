@@ -0,0 +1,10 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class TimeoutsConfiguration(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="TEXTS_TIMEOUTS_")
+
+    # * Опциональные переменные
+    READ: int = 5000
+    WRITE: int = 15000
+    ROUTES: dict[str, int] = {}
@@ -1,3 +1,16 @@
-from .engine import BaseORM, disconnect_db, engine, get_db
+from .engine import BaseORM, disconnect_db, engine, get_db, query_counters
+from .titles import listen_title_changes, title_index
+from .writer import DuplicateTitleError, GroupCommitTimeoutError, text_writer
 
-__all__ = ("BaseORM", "disconnect_db", "engine", "get_db")
+__all__ = (
+    "BaseORM",
+    "DuplicateTitleError",
+    "GroupCommitTimeoutError",
+    "disconnect_db",
+    "engine",
+    "get_db",
+    "listen_title_changes",
+    "query_counters",
+    "text_writer",
+    "title_index",
+)
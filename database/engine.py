@@ -1,7 +1,15 @@
+import time
+from typing import Any
+
+from fastapi import Request
+from sqlalchemy import Connection, event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncAttrs, AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.orm import DeclarativeBase, Session, SessionTransaction, sessionmaker
 
 from configs import configs
+from service_logging import logger
 
 engine: AsyncEngine = create_async_engine(
     configs.database.URL,
@@ -18,6 +26,127 @@ LocalAsyncSession: AsyncSession = sessionmaker(
 )
 
 
+# SQLSTATE query_canceled: запрос прерван по statement_timeout.
+QUERY_CANCELED = "57014"
+# Классы SQLSTATE ошибок в данных строки: data_exception и integrity_constraint_violation.
+ROW_ERROR_CLASSES = ("22", "23")
+
+
+def is_query_canceled(error: BaseException) -> bool:
+    """Проверяет, что ошибка вызвана прерыванием запроса по statement_timeout."""
+    return (
+        isinstance(error, DBAPIError)
+        and getattr(error.orig, "sqlstate", None) == QUERY_CANCELED
+    )
+
+
+def is_row_error(error: BaseException) -> bool:
+    """Проверяет, что ошибка вызвана данными строки, а не состоянием БД.
+
+    Драйвер asyncpg отдает ошибки данных как общий `DBAPIError`, поэтому
+    класс ошибки определяется по SQLSTATE.
+    """
+    return (
+        isinstance(error, DBAPIError)
+        and (getattr(error.orig, "sqlstate", None) or "")[:2] in ROW_ERROR_CLASSES
+    )
+
+
+class QueryCounters:
+    """Счетчики событий выполнения запросов к БД."""
+
+    def __init__(self) -> None:
+        self.timeouts = 0
+        self.slow = 0
+
+    def snapshot(self) -> dict[str, int]:
+        """Возвращает текущие значения счетчиков."""
+        return {"timeouts": self.timeouts, "slow": self.slow}
+
+
+query_counters = QueryCounters()
+
+
+@event.listens_for(Session, "after_begin")
+def apply_statement_timeout(
+    session: Session,
+    transaction: SessionTransaction,
+    connection: Connection,
+) -> None:
+    """Устанавливает statement_timeout в начале каждой транзакции сессии.
+
+    Значение в миллисекундах берется из `session.info["statement_timeout"]`
+    и действует только до конца транзакции (`SET LOCAL`).
+    """
+    timeout = session.info.get("statement_timeout")
+    if timeout:
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout)}")
+
+
+@event.listens_for(engine.sync_engine, "handle_error")
+def count_statement_timeout(context: ExceptionContext) -> None:
+    """Подсчитывает запросы, прерванные по statement_timeout."""
+    if getattr(context.original_exception, "sqlstate", None) == QUERY_CANCELED:
+        query_counters.timeouts += 1
+
+
+def parameters_shape(parameters: Any) -> str:
+    """Описывает структуру параметров запроса без их значений.
+
+    Args:
+        parameters (Any): Параметры, переданные драйверу БД.
+
+    Returns:
+        str: Типы параметров, например `(UUID, int)` или `100 x (str, str)`.
+    """
+    if isinstance(parameters, list):
+        if not parameters:
+            return "[]"
+        return f"{len(parameters)} x {parameters_shape(parameters[0])}"
+
+    if isinstance(parameters, dict):
+        parameters = parameters.values()
+
+    return "(" + ", ".join(type(value).__name__ for value in parameters or ()) + ")"
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def start_query_timer(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    conn.info["query_start"] = time.perf_counter()
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def log_slow_query(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Логирует запросы, выполнявшиеся дольше `TEXTS_DB_SLOW_QUERY_THRESHOLD` мс."""
+    start = conn.info.pop("query_start", None)
+    if start is None:
+        return
+
+    duration = (time.perf_counter() - start) * 1000
+    if duration < configs.database.SLOW_QUERY_THRESHOLD:
+        return
+
+    query_counters.slow += 1
+    logger.warning(
+        f"Slow query ({duration:.1f} ms, {cursor.rowcount} rows, "
+        f"parameters {parameters_shape(parameters)}): {' '.join(statement.split())}"
+    )
+
+
 class BaseORM(AsyncAttrs, DeclarativeBase):
     """Базовый класс модели ORM.
     Использует AsyncAttrs для асинхронного доступа к полям
@@ -32,12 +161,33 @@ async def disconnect_db():
     await engine.dispose()
 
 
-async def get_db():
+def route_statement_timeout(request: Request) -> int:
+    """Возвращает statement_timeout (в миллисекундах) для маршрута запроса.
+
+    Значение берется из `TEXTS_TIMEOUTS_ROUTES` по имени маршрута, иначе
+    используется значение по умолчанию для чтения или записи.
+    """
+    route = request.scope.get("route")
+    timeout = configs.timeouts.ROUTES.get(getattr(route, "name", None))
+    if timeout is not None:
+        return timeout
+
+    read = request.method in ("GET", "HEAD")
+    return configs.timeouts.READ if read else configs.timeouts.WRITE
+
+
+async def get_db(request: Request):
     """Функция возвращает асинхронную сессию взаимодействия с БД
     вместе с контролем интерпретатору.
 
+    Сессия получает statement_timeout маршрута запроса, который применяется
+    в начале каждой ее транзакции (см. `apply_statement_timeout`).
+    Зависимость подключается параметром обработчика, а не зависимостью
+    роутера, чтобы разрешаться после зависимостей допуска (admission).
+
     Yields:
         AsyncSession: Асинхронная сессия работы с БД.
     """
     async with LocalAsyncSession() as session:
+        session.info["statement_timeout"] = route_statement_timeout(request)
         yield session
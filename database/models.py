@@ -1,10 +1,15 @@
 import uuid
 
-from sqlalchemy import Column, Index, String, Text
+from sqlalchemy import BigInteger, Column, DateTime, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 
 from .engine import BaseORM
 
+# Идентификатор текущей транзакции (xid8). В отличие от времени начала
+# транзакции, он позволяет отличить зафиксированные изменения от тех,
+# что еще могут быть зафиксированы (см. ленту изменений).
+CURRENT_XACT_ID = "pg_current_xact_id()::text::bigint"
+
 
 class LearningText(BaseORM):
     """ORM модель, описывающая обучающий текст."""
@@ -15,5 +20,30 @@ class LearningText(BaseORM):
     title = Column(String(100), nullable=False, unique=True)
     value = Column(Text, nullable=False, unique=False)
     transcription = Column(Text, nullable=False, unique=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+    xid = Column(
+        BigInteger,
+        nullable=False,
+        server_default=text(CURRENT_XACT_ID),
+        onupdate=text(CURRENT_XACT_ID),
+    )
+
+    __table_args__ = (Index("learning_text_xid_idx", xid, id),)
+
+
+class LearningTextTombstone(BaseORM):
+    """ORM модель, фиксирующая факт удаления обучающего текста."""
+
+    __tablename__ = "learning_text_tombstones"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    xid = Column(BigInteger, nullable=False, server_default=text(CURRENT_XACT_ID))
 
-    __table_args__ = (Index("learning_text_title_idx", title, postgresql_using="hash"),)
+    __table_args__ = (Index("learning_text_tombstone_xid_idx", xid, id),)
@@ -0,0 +1,78 @@
+"""Облегченный слой чтения для горячих GET запросов.
+
+Запросы строятся на уровне Core по колонкам таблицы и выполняются на
+соединении сессии в обход ORM: без identity map, создания экземпляров
+моделей и инструментирования атрибутов. Выражения собраны один раз на
+уровне модуля, поэтому их компиляция кэшируется SQLAlchemy, а asyncpg
+переиспользует подготовленные (prepared) statement'ы соединения.
+Запись по-прежнему выполняется через ORM.
+"""
+
+from typing import Literal, Sequence
+from uuid import UUID
+
+from sqlalchemy import Row, bindparam, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import LearningText
+
+texts = LearningText.__table__
+
+_summary_columns = (texts.c.id, texts.c.title)
+_detail_columns = (texts.c.id, texts.c.title, texts.c.value, texts.c.transcription)
+
+_text_by_id = select(*_detail_columns).where(texts.c.id == bindparam("id"))
+_text_by_title = select(*_detail_columns).where(texts.c.title == bindparam("title"))
+_titles = select(*_summary_columns)
+_texts_count = select(func.count()).select_from(texts)
+_texts_page = {
+    sort: select(*_summary_columns)
+    .order_by(*order_by)
+    .offset(bindparam("skip"))
+    .limit(bindparam("size"))
+    for sort, order_by in (
+        (None, ()),
+        ("title", (texts.c.title.asc(),)),
+        ("-title", (texts.c.title.desc(),)),
+    )
+}
+
+
+async def select_text(db: AsyncSession, id: UUID) -> Row | None:
+    """Возвращает строку с полной информацией о тексте по его UUID."""
+    connection = await db.connection()
+    result = await connection.execute(_text_by_id, {"id": id})
+    return result.one_or_none()
+
+
+async def select_text_by_title(db: AsyncSession, title: str) -> Row | None:
+    """Возвращает строку с полной информацией о тексте по его названию."""
+    connection = await db.connection()
+    result = await connection.execute(_text_by_title, {"title": title})
+    return result.one_or_none()
+
+
+async def select_texts(
+    db: AsyncSession,
+    skip: int,
+    size: int,
+    sort: Literal["title", "-title"] | None = None,
+) -> Sequence[Row]:
+    """Возвращает страницу строк (id, title) списка текстов."""
+    connection = await db.connection()
+    result = await connection.execute(_texts_page[sort], {"skip": skip, "size": size})
+    return result.all()
+
+
+async def count_texts(db: AsyncSession) -> int:
+    """Возвращает общее количество текстов."""
+    connection = await db.connection()
+    result = await connection.execute(_texts_count)
+    return result.scalar_one()
+
+
+async def select_titles(db: AsyncSession) -> list[tuple[UUID, str]]:
+    """Возвращает пары (id, title) всех текстов."""
+    connection = await db.connection()
+    result = await connection.execute(_titles)
+    return [(id, title) for id, title in result]
@@ -0,0 +1,165 @@
+"""Индекс названий текстов в памяти процесса для автодополнения.
+
+Каждый воркер держит отсортированный список названий и отвечает на поиск
+по префиксу без обращения к БД. Актуальность поддерживается через
+`LISTEN/NOTIFY`: триггер на `learning_texts` публикует изменения названий
+в канал `learning_text_titles`, а фоновая задача применяет их к индексу.
+"""
+
+import asyncio
+import json
+from bisect import bisect_left, insort
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+
+from configs import configs
+from service_logging import logger
+
+from .engine import LocalAsyncSession
+from .repository import select_titles
+
+TITLE_CHANNEL = "learning_text_titles"
+
+# Пауза перед повторным подключением слушателя после сбоя (в секундах).
+RECONNECT_INTERVAL = 5.0
+# Период проверки соединения слушателя (в секундах).
+KEEPALIVE_INTERVAL = 30.0
+
+
+class TitleIndex:
+    """Отсортированный по названию (без учета регистра) индекс текстов."""
+
+    def __init__(self) -> None:
+        self._keys: list[tuple[str, UUID]] = []
+        self._titles: dict[UUID, str] = {}
+        self.ready = False
+        self.reloads = 0
+        self.notifications = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def load(self, rows: list[tuple[UUID, str]]) -> None:
+        """Полностью заменяет содержимое индекса."""
+        self._titles = {id: title for id, title in rows}
+        self._keys = sorted((title.casefold(), id) for id, title in self._titles.items())
+        self.ready = True
+        self.reloads += 1
+
+    def upsert(self, id: UUID, title: str) -> None:
+        """Добавляет текст или обновляет его название."""
+        self.remove(id)
+        self._titles[id] = title
+        insort(self._keys, (title.casefold(), id))
+
+    def remove(self, id: UUID) -> None:
+        """Удаляет текст из индекса, если он там есть."""
+        title = self._titles.pop(id, None)
+        if title is None:
+            return
+
+        key = (title.casefold(), id)
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    def apply(self, change: dict[str, Any]) -> None:
+        """Применяет изменение из уведомления триггера."""
+        id = UUID(change["id"])
+        if change["op"] == "delete":
+            self.remove(id)
+        else:
+            self.upsert(id, change["title"])
+
+    def search(self, prefix: str, limit: int) -> list[tuple[UUID, str]]:
+        """Возвращает до `limit` текстов, названия которых начинаются с `prefix`.
+
+        Args:
+            prefix (str): Префикс названия, регистр не учитывается.
+            limit (int): Максимальное количество результатов.
+
+        Returns:
+            list[tuple[UUID, str]]: Пары (id, title) в алфавитном порядке.
+        """
+        prefix = prefix.casefold()
+        found = []
+        position = bisect_left(self._keys, (prefix,))
+        for key, id in self._keys[position : position + limit]:
+            if not key.startswith(prefix):
+                break
+            found.append((id, self._titles[id]))
+
+        return found
+
+    def snapshot(self) -> dict[str, Any]:
+        """Возвращает текущее состояние индекса."""
+        return {
+            "ready": self.ready,
+            "size": len(self),
+            "reloads": self.reloads,
+            "notifications": self.notifications,
+        }
+
+
+title_index = TitleIndex()
+
+
+async def listen_title_changes(index: TitleIndex = title_index) -> None:
+    """Загружает индекс и поддерживает его актуальным до отмены задачи.
+
+    Подписка на канал выполняется до загрузки снимка, а уведомления,
+    пришедшие во время загрузки, применяются поверх него. При потере
+    соединения индекс перезагружается целиком, так как уведомления
+    за время разрыва потеряны.
+    """
+    while True:
+        connection = None
+        try:
+            connection = await asyncpg.connect(
+                user=configs.database.POSTGRES_USER,
+                password=configs.database.POSTGRES_PASSWORD,
+                host=configs.database.POSTGRES_HOST,
+                port=configs.database.POSTGRES_PORT,
+                database=configs.database.POSTGRES_NAME,
+            )
+            terminated = asyncio.Event()
+            connection.add_termination_listener(lambda _: terminated.set())
+
+            pending: list[dict[str, Any]] | None = []
+
+            def on_notification(_connection: Any, _pid: int, _channel: str, payload: str) -> None:
+                index.notifications += 1
+                change = json.loads(payload)
+                if pending is not None:
+                    pending.append(change)
+                else:
+                    index.apply(change)
+
+            await connection.add_listener(TITLE_CHANNEL, on_notification)
+
+            async with LocalAsyncSession() as db:
+                index.load(await select_titles(db))
+            for change in pending:
+                index.apply(change)
+            pending = None
+
+            logger.success(f"Title index has been loaded: {len(index)} titles.")
+
+            while not terminated.is_set():
+                try:
+                    await asyncio.wait_for(terminated.wait(), KEEPALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    await connection.execute("SELECT 1")
+
+            logger.error("Title index listener connection has been lost.")
+
+        except Exception as error:
+            logger.error(f"Title index listener failed: {error!r}")
+
+        finally:
+            if connection is not None and not connection.is_closed():
+                await connection.close()
+
+        await asyncio.sleep(RECONNECT_INTERVAL)
@@ -0,0 +1,193 @@
+"""Групповая фиксация (group commit) при массовом создании текстов.
+
+Конкурентные запросы на создание накапливаются в течение короткого окна
+или до заполнения пачки, после чего записываются одним многострочным
+`INSERT` и одной фиксацией транзакции. Каждый вызывающий получает свой
+результат: идентификатор созданного текста или `DuplicateTitleError`.
+"""
+
+import asyncio
+import contextvars
+import time
+import uuid
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import insert
+
+from configs import configs
+from service_logging import logger
+
+from .engine import LocalAsyncSession, is_row_error
+from .models import LearningText
+
+texts = LearningText.__table__
+
+# Дубликаты названий (в том числе внутри одной пачки) не прерывают запись
+# остальных строк, а просто не попадают в RETURNING.
+_insert_texts = (
+    insert(texts)
+    .on_conflict_do_nothing(index_elements=[texts.c.title])
+    .returning(texts.c.id)
+)
+
+
+class DuplicateTitleError(Exception):
+    """Текст с таким названием уже существует."""
+
+
+class GroupCommitTimeoutError(Exception):
+    """Пачка с текстом не была зафиксирована за отведенное время."""
+
+
+class GroupCommitWriter:
+    """Писатель, объединяющий конкурентные вставки текстов в пачки.
+
+    Пачки записываются последовательно одной фоновой задачей: пока
+    фиксируется одна пачка, накапливается следующая. Поэтому запись
+    занимает не больше одного соединения с БД, а пропускная способность
+    растет вместе с конкурентностью, а не с частотой fsync.
+    """
+
+    def __init__(self, window: float, max_size: int) -> None:
+        self.window = window
+        self.max_size = max_size
+        self._pending: list[tuple[dict[str, Any], asyncio.Future, float]] = []
+        self._full = asyncio.Event()
+        self._flusher: asyncio.Task | None = None
+        self.batches = 0
+        self.written = 0
+        self.conflicts = 0
+
+    async def create(self, title: str, value: str, transcription: str) -> UUID:
+        """Ставит текст в очередь на запись и ожидает фиксации его пачки.
+
+        Args:
+            title (str): Название текста.
+            value (str): Содержание текста.
+            transcription (str): Транскрипционная запись.
+
+        Raises:
+            DuplicateTitleError: Текст с таким названием уже существует.
+            GroupCommitTimeoutError: Текст не записан за `deadline` секунд.
+
+        Returns:
+            UUID: Идентификатор созданного текста.
+        """
+        row = {
+            "id": uuid.uuid4(),
+            "title": title,
+            "value": value,
+            "transcription": transcription,
+        }
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((row, future, time.monotonic()))
+        if len(self._pending) >= self.max_size:
+            self._full.set()
+
+        if self._flusher is None or self._flusher.done():
+            # Пустой контекст: фоновая задача не должна наследовать
+            # контекст логирования запроса, который ее запустил.
+            self._flusher = asyncio.create_task(self._flush(), context=contextvars.Context())
+
+        try:
+            return await asyncio.wait_for(future, self.deadline)
+        except asyncio.TimeoutError:
+            # Ожидание отменяет future: если пачка еще не записана, строка
+            # в нее не попадет; если запись уже идет, результат теряется.
+            raise GroupCommitTimeoutError(title) from None
+
+    @property
+    def deadline(self) -> float:
+        """Предельное время ожидания записи текста в секундах.
+
+        Перед пачкой текста может записываться предыдущая, и каждая запись
+        ограничена таймаутом запросов на запись.
+        """
+        return self.window + 2 * configs.timeouts.WRITE / 1000
+
+    async def _flush(self) -> None:
+        while self._pending:
+            delay = self._pending[0][2] + self.window - time.monotonic()
+            if delay > 0 and len(self._pending) < self.max_size:
+                try:
+                    await asyncio.wait_for(self._full.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+
+            batch = self._pending[: self.max_size]
+            self._pending = self._pending[self.max_size :]
+            if len(self._pending) < self.max_size:
+                self._full.clear()
+
+            # Запросы, отмененные до записи (клиент отключился), не записываются.
+            batch = [(row, future) for row, future, _ in batch if not future.done()]
+            if not batch:
+                continue
+
+            try:
+                await self._write(batch)
+            finally:
+                # Не оставляем вызывающих ждать вечно, если запись прервана.
+                for _, future in batch:
+                    if not future.done():
+                        future.cancel()
+
+    async def _write(self, batch: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        try:
+            async with LocalAsyncSession() as db:
+                db.info["statement_timeout"] = configs.timeouts.WRITE
+                connection = await db.connection()
+                result = await connection.execute(_insert_texts, [row for row, _ in batch])
+                inserted = set(result.scalars())
+                await db.commit()
+
+        except Exception as error:
+            if len(batch) > 1 and is_row_error(error):
+                # Ошибка данных одной строки не должна ронять всю пачку: пишем по одной.
+                logger.error(
+                    f"Group commit of {len(batch)} texts failed, retrying one by one: {error!r}"
+                )
+                for item in batch:
+                    await self._write([item])
+                return
+
+            # Сбой соединения или таймаут повторился бы для каждой строки
+            # и лишь растянул бы ожидание: отказываем всей пачке сразу.
+            logger.error(f"Group commit of {len(batch)} texts failed: {error!r}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        self.batches += 1
+        self.written += len(inserted)
+        self.conflicts += len(batch) - len(inserted)
+        for row, future in batch:
+            if future.done():
+                continue
+            if row["id"] in inserted:
+                future.set_result(row["id"])
+            else:
+                future.set_exception(DuplicateTitleError(row["title"]))
+
+    async def drain(self) -> None:
+        """Дожидается записи всех поставленных в очередь текстов."""
+        if self._flusher is not None:
+            await asyncio.gather(self._flusher, return_exceptions=True)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Возвращает счетчики записанных пачек и строк."""
+        return {
+            "enabled": configs.group_commit.ENABLE,
+            "pending": len(self._pending),
+            "batches": self.batches,
+            "written": self.written,
+            "conflicts": self.conflicts,
+        }
+
+
+text_writer = GroupCommitWriter(
+    window=configs.group_commit.WINDOW,
+    max_size=configs.group_commit.MAX_SIZE,
+)
@@ -0,0 +1,4 @@
+from .disconnect import CancelOnDisconnectMiddleware, disconnect_counters
+from .profiling import profile_request
+
+__all__ = ("CancelOnDisconnectMiddleware", "disconnect_counters", "profile_request")
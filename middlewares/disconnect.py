@@ -0,0 +1,84 @@
+import asyncio
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from service_logging import logger
+
+# Нестандартный код ответа (nginx): клиент закрыл соединение до ответа.
+CLIENT_CLOSED_REQUEST = 499
+
+
+class DisconnectCounters:
+    """Счетчики запросов, отмененных из-за отключения клиента."""
+
+    def __init__(self) -> None:
+        self.cancellations = 0
+
+    def snapshot(self) -> dict[str, int]:
+        """Возвращает текущие значения счетчиков."""
+        return {"cancellations": self.cancellations}
+
+
+disconnect_counters = DisconnectCounters()
+
+
+class CancelOnDisconnectMiddleware:
+    """ASGI middleware, отменяющий обработку запроса при отключении клиента.
+
+    Сообщения клиента читаются в фоне. Если клиент отключился раньше, чем
+    приложение отправило ответ, задача обработки отменяется: выполняющийся
+    запрос asyncpg прерывается, а соединение возвращается в пул.
+
+    Middleware должен быть самым внутренним: отмена внутри task group
+    `BaseHTTPMiddleware` повторяется на каждом await и прерывает
+    корректное закрытие соединения с БД.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        messages: asyncio.Queue[Message] = asyncio.Queue()
+        response_started = asyncio.Event()
+        response_complete = asyncio.Event()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_started.set()
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body"):
+                response_complete.set()
+
+        handler = asyncio.create_task(self.app(scope, messages.get, send_wrapper))
+
+        async def watch() -> None:
+            while True:
+                message = await receive()
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    if not handler.done() and not response_complete.is_set():
+                        disconnect_counters.cancellations += 1
+                        logger.warning("Client disconnected, cancelling the request...")
+                        handler.cancel()
+                    return
+
+        watcher = asyncio.create_task(watch())
+        try:
+            await handler
+        except asyncio.CancelledError:
+            if not watcher.done():
+                raise
+
+            # Клиент уже отключился, ответ нужен только внешним middleware.
+            if not response_started.is_set():
+                await send(
+                    {"type": "http.response.start", "status": CLIENT_CLOSED_REQUEST, "headers": []}
+                )
+                await send({"type": "http.response.body", "body": b""})
+        finally:
+            watcher.cancel()
+            handler.cancel()
@@ -0,0 +1,67 @@
+import re
+import secrets
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from fastapi import Request, Response
+from fastapi.responses import HTMLResponse
+from pyinstrument import Profiler
+
+from configs import configs
+from service_logging import logger
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_FILE_HEADER = "X-Profile-File"
+
+
+def is_profiling_requested(request: Request) -> bool:
+    """Проверяет, запрошено ли профилирование администратором.
+
+    Args:
+        request (Request): Входящий запрос.
+
+    Returns:
+        bool: True, если заголовок `X-Profile` совпадает с `TEXTS_PROFILING_TOKEN`.
+    """
+    token = configs.profiling.TOKEN
+    header = request.headers.get(PROFILE_HEADER)
+    if not token or header is None:
+        return False
+
+    return secrets.compare_digest(header.encode(), token.encode())
+
+
+async def profile_request(request: Request, call_next: Callable) -> Response:
+    """HTTP middleware, профилирующий отдельный запрос статистическим профайлером.
+
+    Если задан `TEXTS_PROFILING_OUTPUT_DIR`, HTML-отчет сохраняется в файл,
+    а клиент получает исходный ответ с именем файла в заголовке
+    `X-Profile-File`. Иначе вместо ответа возвращается сам HTML-отчет.
+    """
+    if not is_profiling_requested(request):
+        return await call_next(request)
+
+    logger.info(f"Profiling the request {request.method} {request.url.path}...")
+    profiler = Profiler(interval=configs.profiling.INTERVAL, async_mode="enabled")
+    profiler.start()
+    try:
+        response = await call_next(request)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+    finally:
+        profiler.stop()
+
+    report = profiler.output_html()
+
+    if configs.profiling.OUTPUT_DIR is None:
+        return HTMLResponse(content=report)
+
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", request.url.path).strip("-") or "root"
+    path = Path(configs.profiling.OUTPUT_DIR) / f"{timestamp}-{request.method}-{slug}.html"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(report, encoding="utf-8")
+    logger.success(f"Profile has been saved: {path}")
+
+    headers = {**response.headers, PROFILE_FILE_HEADER: path.name}
+    return Response(content=body, status_code=response.status_code, headers=headers)
@@ -28,6 +28,15 @@ target_metadata = BaseORM.metadata
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
 
+# Each migration runs in its own transaction, so a migration can leave it
+# through `autocommit_block()` (see migrations/helpers.py) for operations
+# like CREATE INDEX CONCURRENTLY or batched backfills. DDL waiting on a lock
+# gives up after `lock_timeout` instead of stalling all traffic behind it:
+#   alembic -x lock_timeout=10s upgrade head
+# CREATE/DROP INDEX CONCURRENTLY use `index_lock_timeout` instead (no limit
+# by default), since waiting for older transactions does not block DML.
+lock_timeout = context.get_x_argument(as_dictionary=True).get("lock_timeout", "5s")
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -47,6 +56,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -67,7 +77,14 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        connection.exec_driver_sql(f"SET lock_timeout = '{lock_timeout}'")
+        connection.commit()
+
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            transaction_per_migration=True,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
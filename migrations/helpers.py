@@ -0,0 +1,141 @@
+"""Помощники для миграций, не блокирующих работу сервиса.
+
+Каждая миграция выполняется в отдельной транзакции (см. `env.py`).
+Операции ниже временно выходят из нее в режим autocommit, поэтому
+не удерживают блокировки таблицы дольше одного короткого шага.
+
+Выход в autocommit фиксирует предшествующие операции ревизии до ее
+отметки в `alembic_version`, поэтому помощники вызываются в отдельных
+ревизиях, не содержащих транзакционных изменений схемы. Сами помощники
+идемпотентны, и такую ревизию можно повторить после сбоя.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Sequence
+
+import sqlalchemy as sa
+from alembic import context, op
+
+
+@contextmanager
+def concurrent_index_block() -> Iterator[None]:
+    """Выполняет операции `INDEX CONCURRENTLY` вне транзакции миграции.
+
+    Такие операции ждут завершения более старых транзакций, и это ожидание
+    подчиняется `lock_timeout`. Работу с таблицей оно не блокирует, поэтому
+    на время блока действует отдельный таймаут `-x index_lock_timeout`
+    (по умолчанию `0`, т.е. без ограничения), после чего восстанавливается
+    `-x lock_timeout` миграции (см. `env.py`).
+    """
+    arguments = context.get_x_argument(as_dictionary=True)
+    with context.get_context().autocommit_block():
+        op.execute(f"SET lock_timeout = '{arguments.get('index_lock_timeout', '0')}'")
+        try:
+            yield
+        finally:
+            op.execute(f"SET lock_timeout = '{arguments.get('lock_timeout', '5s')}'")
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[str],
+    **kwargs: Any,
+) -> None:
+    """Создает индекс через `CREATE INDEX CONCURRENTLY`.
+
+    Неудачная попытка оставляет после себя невалидный индекс, поэтому
+    перед созданием индекс с тем же именем удаляется, если он существует.
+
+    Args:
+        index_name (str): Имя индекса.
+        table_name (str): Имя таблицы.
+        columns (Sequence[str]): Индексируемые колонки.
+        **kwargs: Дополнительные аргументы `op.create_index`.
+    """
+    with concurrent_index_block():
+        op.drop_index(
+            index_name,
+            table_name=table_name,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            index_name,
+            table_name,
+            columns,
+            postgresql_concurrently=True,
+            **kwargs,
+        )
+
+
+def drop_index_concurrently(index_name: str, table_name: str, **kwargs: Any) -> None:
+    """Удаляет индекс через `DROP INDEX CONCURRENTLY`.
+
+    Args:
+        index_name (str): Имя индекса.
+        table_name (str): Имя таблицы.
+        **kwargs: Дополнительные аргументы `op.drop_index`.
+    """
+    with concurrent_index_block():
+        op.drop_index(
+            index_name,
+            table_name=table_name,
+            postgresql_concurrently=True,
+            if_exists=True,
+            **kwargs,
+        )
+
+
+def backfill_in_batches(
+    table: sa.Table | sa.TableClause,
+    values: dict[str, Any],
+    where: sa.ColumnElement[bool],
+    batch_size: int = 1000,
+    pause: float = 0.1,
+) -> int:
+    """Заполняет данные в таблице порциями ограниченного размера.
+
+    Каждая порция обновляется и фиксируется отдельно, строки, занятые
+    другими транзакциями, откладываются до следующей порции. Условие
+    `where` должно перестать выполняться для обновленных строк, иначе
+    заполнение не завершится. В offline режиме генерируется один
+    `UPDATE` без разбиения на порции.
+
+    Args:
+        table (sa.Table | sa.TableClause): Таблица с колонкой `id`.
+        values (dict[str, Any]): Новые значения колонок.
+        where (sa.ColumnElement[bool]): Условие отбора еще не заполненных строк.
+        batch_size (int, optional): Размер порции. По умолчанию 1000.
+        pause (float, optional): Пауза между порциями в секундах. По умолчанию 0.1.
+
+    Returns:
+        int: Количество обновленных строк.
+    """
+    if context.is_offline_mode():
+        op.execute(sa.update(table).where(where).values(values))
+        return 0
+
+    batch = (
+        sa.select(table.c.id)
+        .where(where)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    stmt = sa.update(table).where(table.c.id.in_(batch)).values(values)
+    remaining = sa.select(sa.exists().where(where))
+
+    total = 0
+    with context.get_context().autocommit_block():
+        bind = op.get_bind()
+        while True:
+            updated = bind.execute(stmt).rowcount
+            if not updated and not bind.execute(remaining).scalar():
+                break
+
+            total += updated
+            time.sleep(pause)
+
+    return total
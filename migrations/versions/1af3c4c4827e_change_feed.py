@@ -0,0 +1,72 @@
+"""change feed
+
+Revision ID: 1af3c4c4827e
+Revises: 2770451edb03
+Create Date: 2026-10-19 13:20:41.518302
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1af3c4c4827e"
+down_revision: Union[str, None] = "2770451edb03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Индексы для ленты изменений строятся CONCURRENTLY в отдельной ревизии
+# (bacb951db80d): autocommit_block зафиксировал бы колонки этой ревизии
+# до ее отметки в alembic_version, и после сбоя повторный запуск упал бы.
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "learning_texts",
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "learning_texts",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.create_table(
+        "learning_text_tombstones",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "learning_text_tombstone_deleted_at_idx",
+        "learning_text_tombstones",
+        ["deleted_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "learning_text_tombstone_deleted_at_idx",
+        table_name="learning_text_tombstones",
+    )
+    op.drop_table("learning_text_tombstones")
+    op.drop_column("learning_texts", "updated_at")
+    op.drop_column("learning_texts", "created_at")
@@ -0,0 +1,38 @@
+"""drop title hash index
+
+Revision ID: 5c324629d932
+Revises: 82c5dedc2195
+Create Date: 2026-10-19 13:34:12.207713
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c324629d932"
+down_revision: Union[str, None] = "82c5dedc2195"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Уникальное ограничение на title уже создает btree индекс.
+    drop_index_concurrently("learning_text_title_idx", table_name="learning_texts")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    create_index_concurrently(
+        "learning_text_title_idx",
+        "learning_texts",
+        ["title"],
+        unique=False,
+        postgresql_using="hash",
+    )
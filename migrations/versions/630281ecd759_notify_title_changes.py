@@ -0,0 +1,57 @@
+"""notify title changes
+
+Revision ID: 630281ecd759
+Revises: 5c324629d932
+Create Date: 2026-10-19 14:05:37.904115
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "630281ecd759"
+down_revision: Union[str, None] = "5c324629d932"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Уведомления доставляются слушателям только после фиксации транзакции.
+    op.execute(
+        """
+        CREATE FUNCTION notify_learning_text_title() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM pg_notify(
+                    'learning_text_titles',
+                    json_build_object('op', 'delete', 'id', OLD.id)::text
+                );
+            ELSIF TG_OP = 'INSERT' OR NEW.title IS DISTINCT FROM OLD.title THEN
+                PERFORM pg_notify(
+                    'learning_text_titles',
+                    json_build_object('op', 'upsert', 'id', NEW.id, 'title', NEW.title)::text
+                );
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER learning_text_title_notify
+        AFTER INSERT OR UPDATE OR DELETE ON learning_texts
+        FOR EACH ROW EXECUTE FUNCTION notify_learning_text_title()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER learning_text_title_notify ON learning_texts")
+    op.execute("DROP FUNCTION notify_learning_text_title()")
@@ -0,0 +1,33 @@
+"""change feed index
+
+Revision ID: 82c5dedc2195
+Revises: 1af3c4c4827e
+Create Date: 2026-10-19 13:22:05.716348
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "82c5dedc2195"
+down_revision: Union[str, None] = "1af3c4c4827e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Ревизия оставлена пустой: индекс по (updated_at, id) для ленты изменений
+# заменен индексом по (xid, id) в bacb951db80d, и строить его на всей таблице
+# только для того, чтобы затем удалить, незачем. Ревизия сохранена,
+# чтобы не нарушать цепочку для уже примененных БД.
+def upgrade() -> None:
+    """Upgrade schema."""
+    pass
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    pass
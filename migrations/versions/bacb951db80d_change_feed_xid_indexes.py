@@ -0,0 +1,53 @@
+"""change feed xid indexes
+
+Revision ID: bacb951db80d
+Revises: d09692ab58ff
+Create Date: 2026-10-19 15:04:47.201963
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "bacb951db80d"
+down_revision: Union[str, None] = "d09692ab58ff"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Ревизия содержит только идемпотентные операции вне транзакции,
+# поэтому после сбоя ее можно безопасно запустить повторно.
+def upgrade() -> None:
+    """Upgrade schema."""
+    create_index_concurrently("learning_text_xid_idx", "learning_texts", ["xid", "id"])
+    create_index_concurrently(
+        "learning_text_tombstone_xid_idx",
+        "learning_text_tombstones",
+        ["xid", "id"],
+    )
+    # Индекс мог быть создан прежней версией ревизии 82c5dedc2195.
+    drop_index_concurrently("learning_text_updated_at_idx", table_name="learning_texts")
+    drop_index_concurrently(
+        "learning_text_tombstone_deleted_at_idx",
+        table_name="learning_text_tombstones",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    create_index_concurrently(
+        "learning_text_tombstone_deleted_at_idx",
+        "learning_text_tombstones",
+        ["deleted_at", "id"],
+    )
+    drop_index_concurrently(
+        "learning_text_tombstone_xid_idx",
+        table_name="learning_text_tombstones",
+    )
+    drop_index_concurrently("learning_text_xid_idx", table_name="learning_texts")
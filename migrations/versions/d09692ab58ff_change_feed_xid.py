@@ -0,0 +1,39 @@
+"""change feed xid
+
+Revision ID: d09692ab58ff
+Revises: 630281ecd759
+Create Date: 2026-10-19 15:02:11.384520
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d09692ab58ff"
+down_revision: Union[str, None] = "630281ecd759"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CURRENT_XACT_ID = "pg_current_xact_id()::text::bigint"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in ("learning_texts", "learning_text_tombstones"):
+        # Постоянное значение по умолчанию не требует перезаписи таблицы:
+        # существующие строки получают xid 0, т.е. считаются давно зафиксированными.
+        op.add_column(
+            table_name,
+            sa.Column("xid", sa.BigInteger(), server_default="0", nullable=False),
+        )
+        op.alter_column(table_name, "xid", server_default=sa.text(CURRENT_XACT_ID))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("learning_text_tombstones", "xid")
+    op.drop_column("learning_texts", "xid")
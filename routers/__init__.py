@@ -1,4 +1,6 @@
+from .autocomplete import router as autocomplete_router
+from .changes import router as changes_router
 from .health import router as health_router
 from .texts import router as texts_router
 
-__all__ = ("health_router", "texts_router")
+__all__ = ("autocomplete_router", "changes_router", "health_router", "texts_router")
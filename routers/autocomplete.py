@@ -0,0 +1,41 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from database import title_index
+from schemas import LearningTextResponse
+from service_logging import logger
+
+from .utils.negotiation import NegotiatedResponse, negotiate
+
+router = APIRouter(
+    prefix="/autocomplete",
+    default_response_class=NegotiatedResponse,
+    dependencies=[Depends(negotiate)],
+)
+
+
+@router.get("", summary="Автодополнение названий текстов")
+async def autocomplete(
+    prefix: Annotated[
+        str,
+        Query(min_length=1, max_length=100, description="Начало названия без учета регистра"),
+    ],
+    limit: Annotated[int, Query(gt=0, le=100, description="Максимум подсказок")] = 10,
+) -> list[LearningTextResponse]:
+    """Возвращает тексты, названия которых начинаются с префикса.
+
+    Ответ формируется из индекса названий в памяти воркера без обращения к БД.
+    """
+    if not title_index.ready:
+        detail = "Title index is not loaded yet."
+        logger.error(detail)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+        )
+
+    return [
+        LearningTextResponse(id=id, title=title)
+        for id, title in title_index.search(prefix, limit)
+    ]
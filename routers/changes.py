@@ -0,0 +1,109 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import BigInteger, Text, cast, func, literal, null, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import get_db
+from database.models import LearningText, LearningTextTombstone
+from schemas import LearningTextChange, LearningTextChangesResponse
+from service_logging import logger
+
+from .utils.admission import read_admission
+from .utils.cursor import decode_cursor, encode_cursor
+from .utils.negotiation import NegotiatedResponse, negotiate
+
+router = APIRouter(
+    prefix="/changes",
+    default_response_class=NegotiatedResponse,
+    dependencies=[Depends(negotiate)],
+)
+
+# Наименьший xid среди еще не завершенных транзакций: все транзакции
+# с меньшим xid уже зафиксированы или откачены.
+COMMITTED_WATERMARK = cast(
+    cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text), BigInteger
+)
+
+
+@router.get(
+    "",
+    summary="Получить ленту изменений текстов",
+    dependencies=[Depends(read_admission)],
+)
+async def get_changes(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    since: Annotated[str | None, Query(description="Курсор предыдущей порции")] = None,
+    limit: Annotated[int, Query(gt=0, le=1000, description="Размер порции")] = 100,
+) -> LearningTextChangesResponse:
+    """Возвращает добавленные, обновленные и удаленные тексты после курсора.
+
+    Изменения упорядочены по идентификатору записавшей их транзакции (xid)
+    и идентификатору текста, поэтому стоимость синхронизации пропорциональна
+    числу изменений, а не размеру корпуса.
+
+    Отдаются только изменения транзакций с xid ниже наименьшего xid еще
+    выполняющихся транзакций. Любая транзакция, которая зафиксируется позже,
+    имеет xid не меньше этой границы, а значит, ее изменения окажутся после
+    курсора. Поэтому потребитель, проходящий ленту курсором, не пропускает
+    изменений независимо от длительности транзакций. Изменения, сделанные
+    между запросами, могут быть получены в виде последнего состояния текста.
+    """
+    logger.info("Getting the change feed...")
+    upserts = select(
+        literal("upsert").label("op"),
+        LearningText.id,
+        LearningText.xid,
+        LearningText.updated_at.label("changed_at"),
+        LearningText.title,
+        LearningText.value,
+        LearningText.transcription,
+    ).where(LearningText.xid < COMMITTED_WATERMARK)
+
+    deletes = select(
+        literal("delete").label("op"),
+        LearningTextTombstone.id,
+        LearningTextTombstone.xid,
+        LearningTextTombstone.deleted_at.label("changed_at"),
+        cast(null(), Text).label("title"),
+        cast(null(), Text).label("value"),
+        cast(null(), Text).label("transcription"),
+    ).where(LearningTextTombstone.xid < COMMITTED_WATERMARK)
+
+    if since is not None:
+        try:
+            position = decode_cursor(since)
+        except ValueError as error:
+            detail = str(error)
+            logger.error(detail)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=detail,
+            )
+
+        upserts = upserts.where(tuple_(LearningText.xid, LearningText.id) > position)
+        deletes = deletes.where(
+            tuple_(LearningTextTombstone.xid, LearningTextTombstone.id) > position
+        )
+
+    upserts = upserts.order_by(LearningText.xid, LearningText.id).limit(limit + 1)
+    deletes = deletes.order_by(LearningTextTombstone.xid, LearningTextTombstone.id).limit(
+        limit + 1
+    )
+
+    feed = union_all(upserts.subquery().select(), deletes.subquery().select()).subquery()
+    stmt = select(feed).order_by(feed.c.xid, feed.c.id).limit(limit + 1)
+    result = await db.execute(stmt)
+    rows = result.mappings().all()
+
+    has_more = len(rows) > limit
+    items = [LearningTextChange.model_validate(dict(row)) for row in rows[:limit]]
+
+    cursor = since
+    if items:
+        last = rows[len(items) - 1]
+        cursor = encode_cursor(last["xid"], last["id"])
+
+    logger.success(f"Received {len(items)} changes.")
+
+    return LearningTextChangesResponse(items=items, cursor=cursor, has_more=has_more)
@@ -5,8 +5,13 @@ import socket
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import JSONResponse
 
+from database import query_counters, text_writer, title_index
+from middlewares import disconnect_counters
 from service_logging import logger
 
+from .utils.admission import create_limiter, read_limiter, write_limiter
+from .utils.coalescing import reads
+
 router = APIRouter(prefix="/health")
 
 
@@ -34,3 +39,22 @@ async def health_check() -> JSONResponse:
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Health check failed: {str(error)}",
         )
+
+
+@router.get(path="/metrics", summary="Метрики нагрузки", tags=["Health"])
+async def metrics() -> JSONResponse:
+    """Возвращает показатели ограничителей конкурентности, объединения и отмены запросов,
+    а также состояние индекса названий."""
+    return JSONResponse(
+        content={
+            "admission": {
+                "read": read_limiter.snapshot(),
+                "write": write_limiter.snapshot(),
+                "create": create_limiter.snapshot(),
+            },
+            "coalescing": reads.snapshot(),
+            "queries": {**query_counters.snapshot(), **disconnect_counters.snapshot()},
+            "title_index": title_index.snapshot(),
+            "group_commit": text_writer.snapshot(),
+        }
+    )
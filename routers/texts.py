@@ -1,14 +1,21 @@
-from typing import Annotated
+from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Path, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query, status
+from sqlalchemy import any_, bindparam, delete, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import get_db
-from database.models import LearningText
+from configs import configs
+from database import DuplicateTitleError, GroupCommitTimeoutError, get_db, repository, text_writer
+from database.engine import is_query_canceled
+from database.models import LearningText, LearningTextTombstone
 from schemas import (
+    BulkDeleteLearningTextsRequest,
+    BulkLearningTextsResponse,
+    BulkUpdateLearningTextsRequest,
     CreateLearningTextRequest,
     CreateLearningTextResponse,
     DeleteLearningTextResponse,
@@ -19,49 +26,78 @@ from schemas import (
 )
 from service_logging import logger
 
+from .utils.admission import create_admission, read_limiter, write_admission
+from .utils.coalescing import reads
+from .utils.negotiation import NegotiatedResponse, negotiate
 from .utils.pagination import PaginatedResponse, Pagination
 
-router = APIRouter()
+router = APIRouter(
+    default_response_class=NegotiatedResponse,
+    dependencies=[Depends(negotiate)],
+)
+
+# Максимальное число идентификаторов в одном SQL запросе массового изменения.
+BULK_CHUNK_SIZE = 1000
+UUID_ARRAY = ARRAY(PG_UUID(as_uuid=True))
 
 
-@router.get("/", summary="Получить список всех текстов")
+@router.get(
+    "/",
+    summary="Получить список всех текстов",
+)
 async def get_texts(
     pg: Annotated[Pagination, Depends()],
     db: Annotated[AsyncSession, Depends(get_db)],
+    sort: Annotated[
+        Literal["title", "-title"] | None,
+        Query(description="Сортировка по названию (по убыванию с префиксом '-')"),
+    ] = None,
 ) -> PaginatedResponse[LearningTextResponse]:
     """Постранично возвращает список всех обучающих текстов."""
     logger.info("Getting the text list...")
-    stmt = select(LearningText).offset(pg.skip).limit(pg.size)
-    result = await db.execute(stmt)
-    texts = result.scalars().all()
 
-    stmt = select(func.count()).select_from(LearningText)
-    result = await db.execute(stmt)
-    total = result.scalar_one()
+    async def fetch() -> PaginatedResponse[LearningTextResponse]:
+        async with read_limiter.session_slot(db):
+            rows = await repository.select_texts(db, pg.skip, pg.size, sort)
+            total = await repository.count_texts(db)
+
+        items = [LearningTextResponse.model_validate(row) for row in rows]
+        return PaginatedResponse[LearningTextResponse](
+            items=items,
+            page=pg.page,
+            size=pg.size,
+            total=total,
+        )
 
-    items = [LearningTextResponse.model_validate(text) for text in texts]
-    logger.success(f"Received {len(items)} texts.")
+    page = await reads.do(("texts", pg.page, pg.size, sort), fetch)
+    logger.success(f"Received {len(page.items)} texts.")
 
-    return PaginatedResponse[LearningTextResponse](
-        items=items,
-        page=pg.page,
-        size=pg.size,
-        total=total,
-    )
+    return page
 
 
-@router.get("/{uuid}", summary="Получить детальную информацию о тексте")
+@router.get(
+    "/{uuid}",
+    summary="Получить детальную информацию о тексте",
+)
 async def get_text(
     uuid: Annotated[UUID, Path(...)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> DetailLearningTextResponse:
     """Возвращает полную информацию о конкретном тексте по его UUID."""
     logger.info("Getting information about a text...")
-    stmt = select(LearningText).where(LearningText.id == uuid)
-    result = await db.execute(stmt)
-    text = result.scalar_one_or_none()
 
-    if text is None:
+    async def fetch() -> DetailLearningTextResponse | None:
+        async with read_limiter.session_slot(db):
+            row = await repository.select_text(db, uuid)
+
+        if row is None:
+            return None
+
+        return DetailLearningTextResponse.model_validate(row)
+
+    item = await reads.do(("text", uuid), fetch)
+
+    if item is None:
         detail = "Text not found."
         logger.error(detail)
         raise HTTPException(
@@ -69,30 +105,76 @@ async def get_text(
             detail=detail,
         )
 
-    item = DetailLearningTextResponse.model_validate(text)
     logger.success(f"Text received: {item.id}")
 
     return item
 
 
-@router.post("/", summary="Добавить текст в систему")
+@router.get(
+    # Конвертер path: название может содержать "/", в том числе как "%2F".
+    "/by-title/{title:path}",
+    summary="Получить детальную информацию о тексте по названию",
+)
+async def get_text_by_title(
+    title: Annotated[str, Path(max_length=100)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> DetailLearningTextResponse:
+    """Возвращает полную информацию о конкретном тексте по его названию."""
+    logger.info("Getting information about a text by title...")
+
+    async def fetch() -> DetailLearningTextResponse | None:
+        async with read_limiter.session_slot(db):
+            row = await repository.select_text_by_title(db, title)
+
+        if row is None:
+            return None
+
+        return DetailLearningTextResponse.model_validate(row)
+
+    item = await reads.do(("title", title), fetch)
+
+    if item is None:
+        detail = "Text not found."
+        logger.error(detail)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail,
+        )
+
+    logger.success(f"Text received: {item.id}")
+
+    return item
+
+
+@router.post(
+    "/",
+    summary="Добавить текст в систему",
+    dependencies=[Depends(create_admission)],
+)
 async def create_text(
     data: Annotated[CreateLearningTextRequest, Body(...)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> CreateLearningTextResponse:
-    """Добавляет новый текст в систему."""
+    """Добавляет новый текст в систему.
+
+    При включенной групповой фиксации текст записывается вместе с
+    конкурентными запросами на создание одним INSERT и одним COMMIT.
+    """
     logger.info("Creating a text...")
     try:
-        text = LearningText(
-            title=data.title,
-            value=data.value,
-            transcription=data.transcription,
-        )
-        db.add(text)
-        await db.commit()
-        await db.refresh(text)
-
-    except IntegrityError:
+        if configs.group_commit.ENABLE:
+            id = await text_writer.create(data.title, data.value, data.transcription)
+        else:
+            text = LearningText(
+                title=data.title,
+                value=data.value,
+                transcription=data.transcription,
+            )
+            db.add(text)
+            await db.commit()
+            id = text.id
+
+    except (IntegrityError, DuplicateTitleError):
         await db.rollback()
         detail = "Text with this data already exists."
         logger.error(detail)
@@ -103,6 +185,10 @@ async def create_text(
 
     except Exception as error:
         await db.rollback()
+        # Таймаут запроса отдается обработчику приложения (503).
+        if is_query_canceled(error) or isinstance(error, GroupCommitTimeoutError):
+            raise
+
         detail = f"An error ocured while creating text: {error}"
         logger.error(detail)
         raise HTTPException(
@@ -110,13 +196,17 @@ async def create_text(
             detail=detail,
         )
 
-    item = CreateLearningTextResponse.model_validate(text)
+    item = CreateLearningTextResponse(id=id)
     logger.success(f"Text has been created: {item.id}")
 
     return item
 
 
-@router.delete("/{uuid}", summary="Удалить текст из системы")
+@router.delete(
+    "/{uuid}",
+    summary="Удалить текст из системы",
+    dependencies=[Depends(write_admission)],
+)
 async def delete_text(
     uuid: Annotated[UUID, Path(...)],
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -136,6 +226,7 @@ async def delete_text(
         )
 
     await db.delete(text)
+    db.add(LearningTextTombstone(id=text.id))
     await db.commit()
 
     item = DeleteLearningTextResponse.model_validate(text)
@@ -144,7 +235,11 @@ async def delete_text(
     return item
 
 
-@router.patch("/{uuid}", summary="Обновить данные о тексте")
+@router.patch(
+    "/{uuid}",
+    summary="Обновить данные о тексте",
+    dependencies=[Depends(write_admission)],
+)
 async def update_text(
     uuid: Annotated[UUID, Path(...)],
     data: Annotated[UpdateLearningTextRequest, Body(...)],
@@ -184,6 +279,10 @@ async def update_text(
 
     except Exception as error:
         await db.rollback()
+        # Таймаут запроса отдается обработчику приложения (503).
+        if is_query_canceled(error):
+            raise
+
         detail = f"An error ocured while updating text: {error}"
         logger.error(detail)
         raise HTTPException(
@@ -195,3 +294,125 @@ async def update_text(
     logger.success(f"Text has been updated: {item.id}")
 
     return item
+
+
+@router.post(
+    "/bulk-delete",
+    summary="Удалить несколько текстов из системы",
+    dependencies=[Depends(write_admission)],
+)
+async def bulk_delete_texts(
+    data: Annotated[BulkDeleteLearningTextsRequest, Body(...)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> BulkLearningTextsResponse:
+    """Удаляет тексты по списку UUID одним запросом на каждую порцию идентификаторов."""
+    logger.info("Deleting texts in bulk...")
+    ids = list(dict.fromkeys(data.ids))
+    affected = set()
+    try:
+        for start in range(0, len(ids), BULK_CHUNK_SIZE):
+            chunk = ids[start : start + BULK_CHUNK_SIZE]
+            deleted = (
+                delete(LearningText)
+                .where(LearningText.id == any_(bindparam("ids", chunk, type_=UUID_ARRAY)))
+                .returning(LearningText.id)
+                .cte("deleted")
+            )
+            stmt = (
+                insert(LearningTextTombstone)
+                .add_cte(deleted)
+                .from_select(["id"], select(deleted.c.id))
+                .returning(LearningTextTombstone.id)
+            )
+            result = await db.execute(stmt)
+            affected.update(result.scalars())
+
+        await db.commit()
+
+    except Exception as error:
+        await db.rollback()
+        # Таймаут запроса отдается обработчику приложения (503).
+        if is_query_canceled(error):
+            raise
+
+        detail = f"An error ocured while deleting texts: {error}"
+        logger.error(detail)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=detail,
+        )
+
+    response = BulkLearningTextsResponse(
+        affected=[id for id in ids if id in affected],
+        missing=[id for id in ids if id not in affected],
+    )
+    logger.success(f"Texts have been deleted: {len(response.affected)}")
+
+    return response
+
+
+@router.post(
+    "/bulk-update",
+    summary="Обновить данные нескольких текстов",
+    dependencies=[Depends(write_admission)],
+)
+async def bulk_update_texts(
+    data: Annotated[BulkUpdateLearningTextsRequest, Body(...)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> BulkLearningTextsResponse:
+    """Обновляет тексты по списку UUID одним запросом на каждую порцию идентификаторов."""
+    logger.info("Updating texts in bulk...")
+    values = data.model_dump(exclude={"ids"}, exclude_none=True)
+    if not values:
+        detail = "No fields to update."
+        logger.error(detail)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail,
+        )
+
+    ids = list(dict.fromkeys(data.ids))
+    affected = set()
+    try:
+        for start in range(0, len(ids), BULK_CHUNK_SIZE):
+            chunk = ids[start : start + BULK_CHUNK_SIZE]
+            stmt = (
+                update(LearningText)
+                .where(LearningText.id == any_(bindparam("ids", chunk, type_=UUID_ARRAY)))
+                .values(**values)
+                .returning(LearningText.id)
+            )
+            result = await db.execute(stmt)
+            affected.update(result.scalars())
+
+        await db.commit()
+
+    except IntegrityError:
+        await db.rollback()
+        detail = "Text with this data already exists."
+        logger.error(detail)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail,
+        )
+
+    except Exception as error:
+        await db.rollback()
+        # Таймаут запроса отдается обработчику приложения (503).
+        if is_query_canceled(error):
+            raise
+
+        detail = f"An error ocured while updating texts: {error}"
+        logger.error(detail)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=detail,
+        )
+
+    response = BulkLearningTextsResponse(
+        affected=[id for id in ids if id in affected],
+        missing=[id for id in ids if id not in affected],
+    )
+    logger.success(f"Texts have been updated: {len(response.affected)}")
+
+    return response
@@ -0,0 +1,176 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs import configs
+from service_logging import logger
+
+
+class ConcurrencyLimiter:
+    """Ограничитель конкурентности для класса маршрутов.
+
+    Пропускает не более `limit` запросов одновременно. Остальные ждут
+    в очереди ограниченного размера не дольше `queue_timeout` секунд.
+    Запросы, не поместившиеся в очередь или не дождавшиеся слота,
+    отклоняются с кодом 503 и заголовком `Retry-After`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limit: int,
+        queue_size: int,
+        queue_timeout: float,
+        retry_after: int,
+    ) -> None:
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+
+        self._semaphore = asyncio.Semaphore(limit)
+        self.in_flight = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+
+    def _reject(self, reason: str) -> HTTPException:
+        detail = f"Service is overloaded ({self.name}: {reason}), retry later."
+        logger.warning(detail)
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(self.retry_after)},
+        )
+
+    async def _acquire(self) -> None:
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            return
+
+        if self.queued >= self.queue_size:
+            self.rejected_queue_full += 1
+            raise self._reject("queue is full")
+
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except TimeoutError:
+            self.rejected_timeout += 1
+            raise self._reject("queue timeout")
+        finally:
+            self.queued -= 1
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Занимает слот выполнения на время контекста.
+
+        Raises:
+            HTTPException: 503, если запрос не был допущен к выполнению.
+        """
+        await self._acquire()
+        self.admitted += 1
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    @asynccontextmanager
+    async def session_slot(self, db: AsyncSession) -> AsyncIterator[None]:
+        """Занимает слот на время работы с сессией внутри обработчика.
+
+        Используется там, где допуск нельзя выполнить зависимостью, например
+        только ведущим запросом при объединении чтений. Перед освобождением
+        слота сессия закрывается и возвращает соединение в пул.
+
+        Raises:
+            HTTPException: 503, если запрос не был допущен к выполнению.
+        """
+        async with self.slot():
+            try:
+                yield
+            finally:
+                await db.close()
+
+    def snapshot(self) -> dict[str, int | float]:
+        """Возвращает текущие показатели ограничителя."""
+        return {
+            "limit": self.limit,
+            "queue_size": self.queue_size,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+        }
+
+
+def admission(limiter: ConcurrencyLimiter) -> Callable:
+    """Создает зависимость FastAPI, допускающую запрос через ограничитель.
+
+    Зависимость должна подключаться раньше `get_db`, чтобы запрос
+    ожидал в очереди ограничителя, а не в очереди пула соединений.
+
+    Args:
+        limiter (ConcurrencyLimiter): Ограничитель класса маршрутов.
+
+    Returns:
+        Callable: Зависимость с yield, удерживающая слот до конца запроса.
+    """
+
+    async def dependency() -> AsyncIterator[None]:
+        async with limiter.slot():
+            yield
+
+    return dependency
+
+
+read_limiter = ConcurrencyLimiter(
+    name="read",
+    limit=configs.admission.READ_LIMIT,
+    queue_size=configs.admission.READ_QUEUE_SIZE,
+    queue_timeout=configs.admission.QUEUE_TIMEOUT,
+    retry_after=configs.admission.RETRY_AFTER,
+)
+
+write_limiter = ConcurrencyLimiter(
+    name="write",
+    limit=configs.admission.WRITE_LIMIT,
+    queue_size=configs.admission.WRITE_QUEUE_SIZE,
+    queue_timeout=configs.admission.QUEUE_TIMEOUT,
+    retry_after=configs.admission.RETRY_AFTER,
+)
+
+# Запросы на создание при групповой фиксации ожидают пачку, не занимая
+# соединений: запись выполняет одна фоновая задача с одним соединением.
+create_limiter = ConcurrencyLimiter(
+    name="create",
+    limit=configs.group_commit.LIMIT,
+    queue_size=configs.group_commit.QUEUE_SIZE,
+    queue_timeout=configs.admission.QUEUE_TIMEOUT,
+    retry_after=configs.admission.RETRY_AFTER,
+)
+
+read_admission = admission(read_limiter)
+write_admission = admission(write_limiter)
+
+
+async def create_admission() -> AsyncIterator[None]:
+    """Зависимость FastAPI, допускающая запрос на создание текста.
+
+    При включенной групповой фиксации используется отдельный ограничитель
+    `create_limiter`, иначе общий ограничитель записи.
+    """
+    limiter = create_limiter if configs.group_commit.ENABLE else write_limiter
+    async with limiter.slot():
+        yield
@@ -0,0 +1,78 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Объединитель одинаковых конкурентных запросов на чтение.
+
+    Первый запрос с заданным ключом выполняет запрос к БД, остальные
+    запросы с тем же ключом, пришедшие до его завершения, ожидают
+    и получают тот же результат. Результат не кэшируется: после
+    завершения запроса ключ освобождается.
+
+    Слот ограничителя чтения занимает только ведущий запрос внутри `fn`:
+    ожидающие не используют соединений и не должны расходовать лимит.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Выполняет `fn` или присоединяется к уже выполняющемуся вызову.
+
+        Если выполняющий запрос был отменен (например, клиент отключился),
+        ожидающие запросы не получают отмену, а выполняют `fn` повторно.
+
+        Args:
+            key (Hashable): Ключ, однозначно описывающий запрос.
+            fn (Callable[[], Awaitable[T]]): Функция, выполняющая запрос.
+
+        Returns:
+            T: Результат выполнения `fn`.
+        """
+        while True:
+            future = self._in_flight.get(key)
+            if future is None:
+                break
+
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                self.coalesced -= 1
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        self.executed += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            # Исключение будет извлечено ожидающими, если они есть.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Возвращает счетчики выполненных и объединенных запросов."""
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
+
+
+reads = SingleFlight()
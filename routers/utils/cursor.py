@@ -0,0 +1,36 @@
+import base64
+from uuid import UUID
+
+
+def encode_cursor(xid: int, id: UUID) -> str:
+    """Кодирует позицию в ленте изменений в непрозрачную строку.
+
+    Args:
+        xid (int): Идентификатор транзакции последнего полученного изменения.
+        id (UUID): Идентификатор последнего полученного изменения.
+
+    Returns:
+        str: Курсор в формате base64url.
+    """
+    raw = f"{xid}|{id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[int, UUID]:
+    """Декодирует курсор ленты изменений.
+
+    Args:
+        cursor (str): Курсор, ранее полученный из `encode_cursor`.
+
+    Raises:
+        ValueError: Курсор поврежден или имеет неверный формат.
+
+    Returns:
+        tuple[int, UUID]: Идентификатор транзакции и идентификатор изменения.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        xid, id = raw.split("|", maxsplit=1)
+        return int(xid), UUID(id)
+    except Exception as error:
+        raise ValueError(f"Invalid cursor: {cursor}") from error
@@ -0,0 +1,70 @@
+from contextvars import ContextVar
+from typing import Any, Mapping
+
+import msgpack
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.background import BackgroundTask
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+_prefers_msgpack: ContextVar[bool] = ContextVar("prefers_msgpack", default=False)
+
+
+def prefers_msgpack(accept: str) -> bool:
+    """Определяет, предпочитает ли клиент MessagePack вместо JSON.
+
+    Args:
+        accept (str): Значение заголовка `Accept`.
+
+    Returns:
+        bool: True, если вес MessagePack не меньше веса JSON.
+    """
+    msgpack_q, json_q = 0.0, 0.0
+    for media_range in accept.split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+
+        if media_type.lower() in MSGPACK_MEDIA_TYPES:
+            msgpack_q = max(msgpack_q, q)
+        elif media_type.lower() in ("application/json", "application/*", "*/*"):
+            json_q = max(json_q, q)
+
+    return msgpack_q > 0 and msgpack_q >= json_q
+
+
+async def negotiate(request: Request) -> None:
+    """Зависимость FastAPI, запоминающая формат ответа для текущего запроса."""
+    _prefers_msgpack.set(prefers_msgpack(request.headers.get("accept", "")))
+
+
+class NegotiatedResponse(JSONResponse):
+    """Ответ, кодируемый в MessagePack или JSON согласно заголовку `Accept`.
+
+    Формат выбирается зависимостью `negotiate`, по умолчанию используется JSON.
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        headers = {**(headers or {}), "Vary": "Accept"}
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        if _prefers_msgpack.get():
+            self.media_type = MSGPACK_MEDIA_TYPES[0]
+            return msgpack.packb(content)
+
+        return super().render(content)
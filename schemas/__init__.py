@@ -1,18 +1,28 @@
 from .schemas import (
+    BulkDeleteLearningTextsRequest,
+    BulkLearningTextsResponse,
+    BulkUpdateLearningTextsRequest,
     CreateLearningTextRequest,
     CreateLearningTextResponse,
     DeleteLearningTextResponse,
     DetailLearningTextResponse,
+    LearningTextChange,
+    LearningTextChangesResponse,
     LearningTextResponse,
     UpdateLearningTextRequest,
     UpdateLearningTextResponse,
 )
 
 __all__ = (
+    "BulkDeleteLearningTextsRequest",
+    "BulkLearningTextsResponse",
+    "BulkUpdateLearningTextsRequest",
     "CreateLearningTextRequest",
     "CreateLearningTextResponse",
     "DeleteLearningTextResponse",
     "DetailLearningTextResponse",
+    "LearningTextChange",
+    "LearningTextChangesResponse",
     "LearningTextResponse",
     "UpdateLearningTextRequest",
     "UpdateLearningTextResponse",
@@ -19,3 +19,7 @@ TRANSCRIPTION_EXAMPLES = [
     "Dɑːɹk hæd hæd jɚ jɚ ʃi suːt suːt ʃi hæd jɚ jɚ ʃi",
     "hæd suːt jɚ jɚ ʃi dɑːɹk ʃi hæd ʃi dɑːɹk ʃi hæd hæd hæd suːt jɚ suːt",
 ]
+
+CURSOR_EXAMPLES = [
+    "NzM5MXxkMDgxOTFhMS0zYTRmLTQ4ZTMtYmUzYi1mYzNiYjMxNTM2YWY=",
+]
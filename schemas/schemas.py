@@ -1,8 +1,11 @@
+from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from .examples import (
+    CURSOR_EXAMPLES,
     ID_EXAMPLES,
     TITLE_EXAMPLES,
     TRANSCRIPTION_EXAMPLES,
@@ -79,3 +82,74 @@ class UpdateLearningTextResponse(DetailLearningTextResponse):
     transcription: str = Field(
         description="Транскрипционная запись", default=None, examples=TRANSCRIPTION_EXAMPLES
     )
+
+
+class LearningTextChange(BaseSchema):
+    """Запись ленты изменений: добавление/обновление или удаление текста."""
+
+    op: Literal["upsert", "delete"] = Field(description="Тип изменения")
+    id: UUID = Field(description="Уникальный идентификатор", examples=ID_EXAMPLES)
+    changed_at: datetime = Field(description="Время изменения")
+    title: str | None = Field(
+        max_length=100, description="Название", default=None, examples=TITLE_EXAMPLES
+    )
+    value: str | None = Field(description="Содержание", default=None, examples=VALUE_EXAMPLES)
+    transcription: str | None = Field(
+        description="Транскрипционная запись", default=None, examples=TRANSCRIPTION_EXAMPLES
+    )
+
+
+class LearningTextChangesResponse(BaseSchema):
+    """Данные, отправляемые в ответ на запрос ленты изменений."""
+
+    items: list[LearningTextChange] = Field(description="Список изменений")
+    cursor: str | None = Field(
+        description="Курсор для запроса следующей порции изменений", examples=CURSOR_EXAMPLES
+    )
+    has_more: bool = Field(description="Есть ли еще изменения после курсора")
+
+
+class BulkDeleteLearningTextsRequest(BaseSchema):
+    """Данные, требующиеся для массового удаления текстов."""
+
+    ids: list[UUID] = Field(
+        min_length=1,
+        max_length=10_000,
+        description="Уникальные идентификаторы",
+        examples=[ID_EXAMPLES],
+    )
+
+
+class BulkUpdateLearningTextsRequest(BaseSchema):
+    """Данные, требующиеся для массового обновления текстов."""
+
+    ids: list[UUID] = Field(
+        min_length=1,
+        max_length=10_000,
+        description="Уникальные идентификаторы",
+        examples=[ID_EXAMPLES],
+    )
+    title: str | None = Field(
+        max_length=100,
+        description="Название (только для одного текста)",
+        default=None,
+        examples=TITLE_EXAMPLES,
+    )
+    value: str | None = Field(description="Содержание", default=None, examples=VALUE_EXAMPLES)
+    transcription: str | None = Field(
+        description="Транскрипционная запись", default=None, examples=TRANSCRIPTION_EXAMPLES
+    )
+
+    @model_validator(mode="after")
+    def check_title(self) -> "BulkUpdateLearningTextsRequest":
+        """Запрещает одно название для нескольких текстов: названия уникальны."""
+        if self.title is not None and len(set(self.ids)) > 1:
+            raise ValueError("Title can only be updated for a single text.")
+        return self
+
+
+class BulkLearningTextsResponse(BaseSchema):
+    """Данные, отправляемые в ответ на запрос массового изменения текстов."""
+
+    affected: list[UUID] = Field(description="Измененные тексты", examples=[ID_EXAMPLES])
+    missing: list[UUID] = Field(description="Не найденные тексты", examples=[[]])